@@ -31,12 +31,12 @@ USER_AGENT: str = (
 
 PAGE_LOAD_TIMEOUT: int = 30_000          # 30 s
 NAVIGATION_TIMEOUT: int = 30_000         # 30 s
-SEARCH_WAIT: float = 3.0                 # seconds after search submit
+SEARCH_WAIT: float = 3.0                 # max wait for first batch (seconds)
 
 # ── Scroll behaviour ─────────────────────────────────────────────────────────
 
-SCROLL_PAUSE_MIN: float = 1.5            # min random sleep (seconds)
-SCROLL_PAUSE_MAX: float = 3.0            # max random sleep (seconds)
+SCROLL_JITTER_MAX: float = 0.75          # human-like jitter cap before waiting
+SCROLL_NEW_CARDS_TIMEOUT: float = 2.25   # max wait for new cards (seconds)
 SCROLL_DISTANCE_MIN: int = 1000          # min mouse-wheel delta
 SCROLL_DISTANCE_MAX: int = 3000          # max mouse-wheel delta
 MAX_STALE_ATTEMPTS: int = 3              # unchanged count -> stop
@@ -50,7 +50,11 @@ RETRY_BACKOFF_MAX: float = 30.0          # cap wait time (seconds)
 # ── Output ────────────────────────────────────────────────────────────────────
 
 OUTPUT_DIR: Path = DATA_DIR
+EXPORT_COMPRESS: bool = False            # zstd-compress CSV/JSON/JSONL (.zst)
 ENABLE_SCREENSHOTS: bool = True
+VERBOSE_LOGGING: bool = False            # DEBUG records in the log file
+SCREENSHOT_FULL_PAGE: bool = False       # stitch the whole page (slow)
+SCREENSHOT_QUALITY: int = 60             # JPEG quality (0-100)
 DEFAULT_MAX_RESULTS: int = 50
 
 # ── Google Maps selectors (CSS) ──────────────────────────────────────────────
@@ -76,7 +80,11 @@ ENRICHER_MAX_WORKERS: int = 15              # Concurrent threads
 ENRICHER_REQUEST_TIMEOUT: int = 10          # Seconds per HTTP request
 ENRICHER_SAME_DOMAIN_DELAY: float = 2.0     # Rate limit same domain (seconds)
 ENRICHER_ENABLE_TIER3: bool = True          # Playwright JS rendering tier
+ENRICHER_TIER3_WORKERS: int = 2             # Reused Chromium instances
 ENRICHER_MAX_RETRIES: int = 3               # HTTP retry attempts per URL
+ENRICHER_DOMAIN_MAX_FAILURES: int = 3       # Failed URLs before a cooldown
+ENRICHER_DOMAIN_COOLDOWN: float = 300.0     # Skip a failing domain (seconds)
+ENRICHER_RETRY_AFTER_MAX: float = 30.0      # Longest Retry-After we wait out
 
 # JS framework keywords that trigger Tier 3 rendering
 JS_FRAMEWORK_KEYWORDS: list = [
@@ -7,6 +7,7 @@ import urllib.parse
 
 from loguru import logger
 from playwright.sync_api import Page, sync_playwright, BrowserContext
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 
 import src.config as cfg
@@ -56,6 +57,15 @@ def create_browser_context() -> tuple:
     return pw, browser, context, page
 
 
+def _is_visible_now(page: Page, selector: str) -> bool:
+    """One-shot visibility check for *selector* (no polling, no timeout)."""
+    return page.evaluate(
+        "sel => { const el = document.querySelector(sel);"
+        " return !!(el && el.offsetParent !== null); }",
+        selector,
+    )
+
+
 def search_maps(page: Page, query: str) -> None:
     """
     Navigate directly to Google Maps search results for *query*.
@@ -75,9 +85,8 @@ def search_maps(page: Page, query: str) -> None:
 
     # Dismiss cookie consent banner if present
     try:
-        accept_btn = page.locator(cfg.ACCEPT_COOKIES)
-        if accept_btn.is_visible(timeout=3000):
-            accept_btn.click()
+        if _is_visible_now(page, cfg.ACCEPT_COOKIES):
+            page.locator(cfg.ACCEPT_COOKIES).click()
             logger.info("Cookie consent dismissed")
             time.sleep(1)
     except Exception:
@@ -91,7 +100,16 @@ def search_maps(page: Page, query: str) -> None:
     page.locator(cfg.RESULT_CARD).first.wait_for(
         state="attached", timeout=cfg.PAGE_LOAD_TIMEOUT
     )
-    time.sleep(cfg.SEARCH_WAIT)
+    # Give the rest of the batch up to SEARCH_WAIT to appear, but move on
+    # as soon as more than one card is in the feed
+    try:
+        page.wait_for_function(
+            "sel => document.querySelectorAll(sel).length > 1",
+            arg=cfg.RESULT_CARD,
+            timeout=cfg.SEARCH_WAIT * 1000,
+        )
+    except PlaywrightTimeoutError:
+        pass  # single-result search -- nothing more to wait for
     logger.info("Results feed loaded")
 
 
@@ -3,8 +3,11 @@ Robust error handling: retry logic, screenshot capture, checkpoint save/load.
 """
 
 import json
+import os
+import random
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, List
 
@@ -13,6 +16,11 @@ from playwright.sync_api import Page
 
 import src.config as cfg
 
+try:  # C-level JSON encoder; fall back to the stdlib when not installed
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ErrorHandler:
     """Centralised error handling and recovery utilities."""
@@ -31,7 +39,7 @@ class ErrorHandler:
             str(log_path),
             rotation="10 MB",
             retention="7 days",
-            level="DEBUG",
+            level="DEBUG" if cfg.VERBOSE_LOGGING else "INFO",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level:<8} | {message}",
         )
         logger.info("Logging initialised  ->  {}", cfg.LOGS_DIR)
@@ -45,10 +53,19 @@ class ErrorHandler:
             return None
 
         cfg.LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = cfg.LOGS_DIR / f"{ts}_{error_name}.png"
+        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = cfg.LOGS_DIR / f"{ts}_{error_name}.jpg"
         try:
-            page.screenshot(path=str(filename), full_page=True)
+            # Viewport-only JPEG: full-page PNGs of a long feed take seconds
+            # and tens of MB, and the visible area is enough to debug
+            page.screenshot(
+                path=str(filename),
+                full_page=cfg.SCREENSHOT_FULL_PAGE,
+                type="jpeg",
+                quality=cfg.SCREENSHOT_QUALITY,
+                animations="disabled",
+                caret="hide",
+            )
             logger.warning("Screenshot saved  ->  {}", filename)
             return filename
         except Exception as exc:
@@ -65,7 +82,7 @@ class ErrorHandler:
         **kwargs: Any,
     ) -> Any:
         """
-        Call *func* up to *max_retries* times with exponential backoff.
+        Call *func* up to *max_retries* times with jittered exponential backoff.
 
         Returns the result of the first successful call.
         Raises the last exception if all retries fail.
@@ -76,8 +93,10 @@ class ErrorHandler:
                 return func(*args, **kwargs)
             except Exception as exc:
                 last_exc = exc
+                # Up to 1s of jitter so concurrent callers don't retry in
+                # lockstep at 2s, 4s, 8s ...
                 wait = min(
-                    cfg.RETRY_BACKOFF_BASE ** attempt,
+                    cfg.RETRY_BACKOFF_BASE ** attempt + random.random(),
                     cfg.RETRY_BACKOFF_MAX,
                 )
                 logger.warning(
@@ -93,17 +112,32 @@ class ErrorHandler:
     # -- Checkpoint (save / load) ------------------------------------------
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _checkpoint_path(query_name: str) -> Path:
         return cfg.LOGS_DIR / f"resume_{query_name}.json"
 
     @staticmethod
-    def save_checkpoint(data: List[dict], query_name: str) -> None:
-        """Persist intermediate results so a crashed run can resume."""
+    def save_checkpoint(data: List[dict] | bytes, query_name: str) -> None:
+        """
+        Persist intermediate results so a crashed run can resume.
+
+        *data* is either a list of records or an already-encoded JSON
+        array (written as-is).
+        """
         path = ErrorHandler._checkpoint_path(query_name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, default=str)
-        logger.debug("Checkpoint saved ({} records)  ->  {}", len(data), path)
+        if isinstance(data, bytes):
+            blob = data
+        elif orjson is not None:
+            blob = orjson.dumps(data, default=str)
+        else:
+            blob = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        # Write to a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated checkpoint behind
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+        logger.debug("Checkpoint saved ({} bytes)  ->  {}", len(blob), path)
 
     @staticmethod
     def load_checkpoint(query_name: str) -> List[dict] | None:
@@ -111,8 +145,8 @@ class ErrorHandler:
         path = ErrorHandler._checkpoint_path(query_name)
         if not path.exists():
             return None
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.info("Checkpoint loaded ({} records)  <-  {}", len(data), path)
         return data
 
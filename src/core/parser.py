@@ -1,15 +1,15 @@
 """
-Data extraction -- turns Playwright locators into Pydantic models.
+Data extraction -- turns the rendered result cards into Pydantic models.
 
 Extracts all visible info from each Google Maps sidebar card:
 name, link, phone, website, address, rating, reviews, category.
 """
 
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 from loguru import logger
-from playwright.sync_api import Locator, Page
+from playwright.sync_api import Page
 
 import src.config as cfg
 from src.models.business import Business
@@ -26,66 +26,124 @@ _PHONE_RE = re.compile(
 # Rating line: "4.6(23)" or "4.6 (23)" or just "4.6"
 _RATING_RE = re.compile(r"(\d\.\d)\s*(?:\((\d[\d,]*)\))?")
 
+# Review count wrapped onto the next line after the rating: "(1,234)" -- but not
+# a phone area code like "(07) 4122 1226"
+_REVIEWS_LINE_RE = re.compile(r"\((\d[\d,]*)\)(?!\s*\d)")
+
+
+# ── In-page extraction ───────────────────────────────────────────────────────
+
+# Runs inside the browser and collects every card in one CDP round-trip
+# instead of 4 per card (aria-label, href, parent text, website button).
+# Unnamed and repeated links are dropped here so innerText (which forces
+# layout) is only read once per usable listing.
+_CARDS_JS = """
+([cardSel, websiteSel]) => {
+    const seen = new Set();
+    const cards = [];
+    for (const a of document.querySelectorAll(cardSel)) {
+        const name = a.getAttribute("aria-label") || "";
+        const link = a.getAttribute("href") || "";
+        if (!name || !link || seen.has(link)) continue;
+        seen.add(link);
+        const p = a.parentElement;
+        const site = p ? p.querySelector(websiteSel) : null;
+        cards.push({
+            name: name,
+            link: link,
+            text: p ? p.innerText : "",
+            website: site ? site.getAttribute("href") : null,
+        });
+    }
+    return cards;
+}
+"""
 
-# ── Text-parsing helpers ─────────────────────────────────────────────────────
-
-def _extract_phone(text: str) -> Optional[str]:
-    """Find the first phone-number-like string in *text*."""
-    for line in text.splitlines():
-        line = line.strip()
-        match = _PHONE_RE.search(line)
-        if match:
-            candidate = match.group(0).strip()
-            # Must have at least 8 digits to be a real phone number
-            digits = re.sub(r"\D", "", candidate)
-            if len(digits) >= 8:
-                return candidate
-    return None
-
-
-def _extract_rating_reviews(text: str) -> Tuple[Optional[float], Optional[int]]:
-    """Pull star rating and review count from card text."""
-    match = _RATING_RE.search(text)
-    if not match:
-        return None, None
-
-    rating = float(match.group(1))
-    if not (1.0 <= rating <= 5.0):
-        return None, None
-
-    reviews = None
-    if match.group(2):
-        reviews = int(match.group(2).replace(",", ""))
-
-    return rating, reviews
 
+# ── Text-parsing helpers ─────────────────────────────────────────────────────
 
-def _extract_category_and_address(text: str) -> Tuple[Optional[str], Optional[str]]:
+def _parse_card(text: str) -> dict:
     """
-    Google Maps usually shows a line like:
-        "Plumber · 89 Tooley St"
-    Split on the middle-dot separator to get category and address.
+    Walk the card text once and pull out every structured field.
+
+    - phone: first phone-number-like string with at least 8 digits
+    - rating / reviews: first "4.6(23)"-style match, rating in 1.0-5.0;
+      a "(23)" starting the next non-blank line also counts as the reviews
+    - category / address: first line like "Plumber · 89 Tooley St",
+      split on the unicode middle dot
     """
-    for line in text.splitlines():
+    fields: dict = {
+        "phone": None,
+        "rating": None,
+        "reviews": None,
+        "category": None,
+        "address": None,
+    }
+    need_phone = need_rating = need_category = True
+
+    lines = text.splitlines()
+    for i, line in enumerate(lines):
+        if not (need_phone or need_rating or need_category):
+            break
         line = line.strip()
-        if "\u00b7" in line:                    # unicode middle dot ·
+        if not line:
+            continue
+
+        if need_phone:
+            match = _PHONE_RE.search(line)
+            if match:
+                candidate = match.group(0).strip()
+                # Must have at least 8 digits to be a real phone number
+                if sum(ch.isdigit() for ch in candidate) >= 8:
+                    fields["phone"] = candidate
+                    need_phone = False
+
+        if need_rating:
+            match = _RATING_RE.search(line)
+            if match:
+                need_rating = False
+                rating = float(match.group(1))
+                if 1.0 <= rating <= 5.0:
+                    fields["rating"] = rating
+                    reviews = match.group(2)
+                    if reviews is None and match.end() == len(line):
+                        following = next(
+                            (n.strip() for n in lines[i + 1:] if n.strip()), ""
+                        )
+                        wrapped = _REVIEWS_LINE_RE.match(following)
+                        if wrapped:
+                            reviews = wrapped.group(1)
+                    if reviews:
+                        fields["reviews"] = int(reviews.replace(",", ""))
+
+        if need_category and "\u00b7" in line:     # unicode middle dot ·
             parts = [p.strip() for p in line.split("\u00b7")]
+            fields["category"] = parts[0]
             if len(parts) >= 2:
-                return parts[0], parts[1]
-            if len(parts) == 1:
-                return parts[0], None
-    return None, None
+                fields["address"] = parts[1]
+            need_category = False
 
+    return fields
 
-def _get_website_url(container: Locator) -> Optional[str]:
-    """Look for the 'Website' action button inside the card container."""
-    try:
-        link = container.locator(cfg.WEBSITE_LINK)
-        if link.count():
-            return link.first.get_attribute("href")
-    except Exception:
-        pass
-    return None
+
+def _parse_one(card: dict, query_name: str) -> Optional[Business]:
+    """Turn one in-page card record into a ``Business`` (None if unusable)."""
+    name = card.get("name") or ""
+    link = card.get("link") or ""
+    if not name or not link:
+        return None
+
+    # Full visible text of the card container (parent of the link)
+    fields = _parse_card(card.get("text") or "")
+
+    # Every field is already the right type, so skip per-field validation
+    return Business.from_trusted(
+        name=name.strip(),
+        link=link.strip(),
+        website=card.get("website"),  # from the action button
+        query_source=query_name,
+        **fields,
+    )
 
 
 # ── Main extraction ──────────────────────────────────────────────────────────
@@ -108,56 +166,26 @@ def extract_listings(page: Page, query_name: str) -> List[Business]:
     List[Business]
         De-duplicated list of scraped entries.
     """
-    cards = page.locator(cfg.RESULT_CARD).all()
+    cards = page.evaluate(_CARDS_JS, [cfg.RESULT_CARD, cfg.WEBSITE_LINK])
     logger.info("Parsing {} result cards ...", len(cards))
 
     seen_links: set = set()
     results: List[Business] = []
 
     for card in cards:
+        # De-duplicate before parsing so repeated cards cost nothing
+        link = card.get("link")
+        if link in seen_links:
+            continue
         try:
-            name = card.get_attribute("aria-label") or ""
-            link = card.get_attribute("href") or ""
-
-            if not name or not link:
-                continue
-            if link in seen_links:
-                continue
-            seen_links.add(link)
-
-            # Navigate to the card container (parent holds all card content)
-            container = card.locator("xpath=..")
-
-            # Get full visible text from the card container
-            try:
-                card_text = container.inner_text(timeout=2000)
-            except Exception:
-                card_text = ""
-
-            # Parse structured data from text
-            phone = _extract_phone(card_text)
-            rating, reviews = _extract_rating_reviews(card_text)
-            category, address = _extract_category_and_address(card_text)
-
-            # Website link from action button
-            website = _get_website_url(container)
-
-            results.append(
-                Business(
-                    name=name.strip(),
-                    link=link.strip(),
-                    phone=phone,
-                    website=website,
-                    address=address,
-                    rating=rating,
-                    reviews=reviews,
-                    category=category,
-                    query_source=query_name,
-                )
-            )
+            business = _parse_one(card, query_name)
         except Exception as exc:
             logger.warning("Failed to parse a card: {}", exc)
             continue
+        if business is None:
+            continue
+        seen_links.add(link)
+        results.append(business)
 
     logger.info(
         "Extracted {} unique listings (from {} cards)",
@@ -9,12 +9,29 @@ import random
 import time
 
 from loguru import logger
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 import src.config as cfg
 from src.core.error_handler import ErrorHandler
 
 
+# Card count and end-of-list visibility in a single CDP round-trip
+_SCROLL_STATS_JS = """
+([cardSel, endSel]) => {
+    const end = document.querySelector(endSel);
+    return {
+        cards: document.querySelectorAll(cardSel).length,
+        end: end ? end.offsetParent !== null : false,
+    };
+}
+"""
+
+# Resolves as soon as more cards than *prev* are in the DOM
+_NEW_CARDS_JS = (
+    "([cardSel, prev]) => document.querySelectorAll(cardSel).length > prev"
+)
+
+
 def perform_infinite_scroll(
     page: Page,
     max_listings: int,
@@ -66,12 +83,26 @@ def perform_infinite_scroll(
             error_handler.take_screenshot(page, "scroll_error")
             break
 
-        # -- Human-like pause ----------------------------------------------
-        pause = random.uniform(cfg.SCROLL_PAUSE_MIN, cfg.SCROLL_PAUSE_MAX)
-        time.sleep(pause)
+        # -- Human-like pause, then wait for new cards --------------------
+        # Short random floor keeps the rhythm human; after that, return the
+        # moment new cards render instead of always sleeping the worst case.
+        time.sleep(
+            random.uniform(cfg.SCROLL_JITTER_MAX / 2, cfg.SCROLL_JITTER_MAX)
+        )
+        try:
+            page.wait_for_function(
+                _NEW_CARDS_JS,
+                arg=[cfg.RESULT_CARD, previous_count],
+                timeout=cfg.SCROLL_NEW_CARDS_TIMEOUT * 1000,
+            )
+        except PlaywrightTimeoutError:
+            pass  # nothing new -- counted as a stale round below
 
-        # -- Count current listings ----------------------------------------
-        current_count = page.locator(cfg.RESULT_CARD).count()
+        # -- Count listings + check for "end of list" text -----------------
+        stats = page.evaluate(
+            _SCROLL_STATS_JS, [cfg.RESULT_CARD, cfg.END_OF_LIST]
+        )
+        current_count = stats["cards"]
         logger.debug(
             "Listings loaded: {} (previous: {}, stale rounds: {})",
             current_count,
@@ -79,16 +110,11 @@ def perform_infinite_scroll(
             stale_rounds,
         )
 
-        # -- Check for "end of list" text ----------------------------------
-        try:
-            end_marker = page.locator(cfg.END_OF_LIST)
-            if end_marker.count() and end_marker.first.is_visible(timeout=500):
-                logger.info(
-                    "Reached end of list ({} listings loaded)", current_count
-                )
-                break
-        except Exception:
-            pass  # marker not found -- keep scrolling
+        if stats["end"]:
+            logger.info(
+                "Reached end of list ({} listings loaded)", current_count
+            )
+            break
 
         # -- Stale-count detection -----------------------------------------
         if current_count == previous_count:
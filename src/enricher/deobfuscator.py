@@ -34,10 +34,9 @@ def decode_cloudflare_email(encoded: str) -> Optional[str]:
         if len(encoded) < 4 or len(encoded) % 2 != 0:
             return None
 
-        key = int(encoded[:2], 16)
-        result = ""
-        for i in range(2, len(encoded), 2):
-            result += chr(int(encoded[i : i + 2], 16) ^ key)
+        buf = bytes.fromhex(encoded)
+        key = buf[0]
+        result = bytes(b ^ key for b in buf[1:]).decode("latin-1")
 
         # Sanity check: must look like an email
         if "@" in result and "." in result.split("@")[-1]:
@@ -69,9 +69,39 @@ _FILE_EXT_RE = re.compile(
 # ── Core email format regex ──────────────────────────────────────────────
 
 _EMAIL_FORMAT_RE = re.compile(
-    r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$"
+    r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
 )
 
+# ── Blocklists compiled to fast lookups ──────────────────────────────────
+
+# Reversed-label trie: "mail.example.com" walks com -> example and stops at
+# the first terminal node, so the cost depends on the label count only.
+_TERMINAL = object()
+_DOMAIN_TRIE: dict = {}
+for _blocked in BLOCKLIST_DOMAINS:
+    _node = _DOMAIN_TRIE
+    for _label in reversed(_blocked.split(".")):
+        _node = _node.setdefault(_label, {})
+    _node[_TERMINAL] = True
+del _blocked, _node, _label
+
+# Blocked when the local part is a prefix or starts with "prefix." -- i.e.
+# when the label before the first dot is one of the prefixes (none of
+# them contain a dot themselves)
+_BLOCKED_PREFIXES = frozenset(BLOCKLIST_LOCAL_PREFIXES)
+
+
+def _is_blocked_domain(domain: str) -> bool:
+    """True if *domain* or any parent domain is in ``BLOCKLIST_DOMAINS``."""
+    node = _DOMAIN_TRIE
+    for label in reversed(domain.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if _TERMINAL in node:
+            return True
+    return False
+
 
 def is_valid_email(email: Optional[str]) -> bool:
     """
@@ -83,27 +113,22 @@ def is_valid_email(email: Optional[str]) -> bool:
     email = email.strip().lower()
 
     # Basic format
-    if not _EMAIL_FORMAT_RE.match(email):
+    if not _EMAIL_FORMAT_RE.fullmatch(email):
         return False
 
     # File extension masquerading as email
     if _FILE_EXT_RE.search(email):
         return False
 
-    # Domain blocklist
-    domain = email.split("@", 1)[1]
-    if domain in BLOCKLIST_DOMAINS:
+    local, domain = email.split("@", 1)
+
+    # Domain blocklist (including sub-domains)
+    if _is_blocked_domain(domain):
         return False
-    # Sub-domain check (e.g. mail.example.com)
-    for blocked in BLOCKLIST_DOMAINS:
-        if domain.endswith("." + blocked):
-            return False
 
     # Local-part prefix blocklist
-    local = email.split("@", 1)[0]
-    for prefix in BLOCKLIST_LOCAL_PREFIXES:
-        if local == prefix or local.startswith(prefix + "."):
-            return False
+    if local.partition(".")[0] in _BLOCKED_PREFIXES:
+        return False
 
     return True
 
@@ -116,9 +141,10 @@ def clean_email(raw: str) -> Optional[str]:
     """
     if not raw:
         return None
-    cleaned = raw.strip().lower().rstrip(".")
-    # Remove trailing query strings or anchors that sometimes stick
-    cleaned = cleaned.split("?")[0].split("#")[0]
+    cleaned = raw.strip().lower()
+    # Remove trailing query strings or anchors that sometimes stick, then
+    # any sentence-ending dot
+    cleaned = cleaned.partition("?")[0].partition("#")[0].rstrip(".")
     if is_valid_email(cleaned):
         return cleaned
     return None
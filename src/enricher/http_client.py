@@ -3,14 +3,18 @@ Stealth HTTP client using curl_cffi for TLS-fingerprint evasion.
 
 Wraps curl_cffi.requests with:
 - Chrome TLS impersonation
+- Per-thread keep-alive sessions (connection reuse)
 - Header rotation
 - Per-domain rate limiting
-- Retry with exponential backoff
+- AIMD concurrency cap that shrinks on HTTP 429 (honours Retry-After)
+- Retry with jittered exponential backoff
+- Per-domain cooldown after repeated failures
 """
 
 import random
 import time
 import threading
+from contextlib import contextmanager
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -21,21 +25,86 @@ import src.config as cfg
 
 # ── Rotating header pools ─────────────────────────────────────────────────
 
-_USER_AGENTS = [
+_USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) Gecko/20100101 Firefox/128.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.5; rv:128.0) Gecko/20100101 Firefox/128.0",
-]
+)
 
-_ACCEPT_LANGUAGES = [
+_ACCEPT_LANGUAGES = (
     "en-US,en;q=0.9",
     "en-GB,en;q=0.9",
     "en-AU,en;q=0.9",
     "en-US,en;q=0.9,fr;q=0.8",
     "en;q=0.9",
-]
+)
+
+# Headers that never change between requests
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# ── Per-domain rate limiting ──────────────────────────────────────────────
+
+_RATE_LIMIT_SHARDS = 32                  # power of two (masked below)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD cap on requests in flight across all enrichment workers.
+
+    The cap grows by one after each success and halves on an HTTP 429, so
+    parallel workers back off together instead of retrying in a storm.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1) -> None:
+        self._max = max_limit
+        self._min = min_limit
+        self._limit = max_limit
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @contextmanager
+    def acquire(self):
+        """Block until a slot under the current cap is free."""
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def on_success(self) -> None:
+        with self._cond:
+            if self._limit < self._max:
+                self._limit += 1
+                self._cond.notify()
+
+    def on_429(self) -> None:
+        with self._cond:
+            self._limit = max(self._limit // 2, self._min)
+
+
+def _retry_after(resp) -> Optional[float]:
+    """Seconds from a numeric ``Retry-After`` header, or None if absent."""
+    try:
+        return max(float(resp.headers.get("Retry-After")), 0.0)
+    except (AttributeError, TypeError, ValueError):
+        return None
 
 
 class StealthHTTPClient:
@@ -46,33 +115,61 @@ class StealthHTTPClient:
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._domain_timestamps: dict[str, float] = {}
+        # Per-domain state striped across independent locks so workers
+        # hitting different domains don't contend on one mutex.  Each shard
+        # holds (lock, next send slot, (consecutive failures, last failure))
+        self._shards: list[
+            tuple[threading.Lock, dict[str, float], dict[str, tuple[int, float]]]
+        ] = [(threading.Lock(), {}, {}) for _ in range(_RATE_LIMIT_SHARDS)]
+        # One keep-alive Session per worker thread: TCP/TLS connections are
+        # reused across requests, and sessions are never shared between threads
+        self._local = threading.local()
+        # Shared by every worker thread that calls get()
+        self._limiter = AdaptiveLimiter(cfg.ENRICHER_MAX_WORKERS)
 
-    @staticmethod
-    def _random_headers(url: str) -> dict:
-        """Generate randomised but realistic browser headers."""
-        parsed = urlparse(url)
-        return {
-            "User-Agent": random.choice(_USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": random.choice(_ACCEPT_LANGUAGES),
-            "Accept-Encoding": "gzip, deflate, br",
-            "Referer": f"{parsed.scheme}://{parsed.netloc}/",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+    def _session(self) -> cffi_requests.Session:
+        """Return this thread's Session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = cffi_requests.Session(impersonate="chrome120")
+            self._local.session = session
+        return session
+
+    def _shard(self, domain: str) -> tuple:
+        return self._shards[hash(domain) & (_RATE_LIMIT_SHARDS - 1)]
 
     def _rate_limit(self, domain: str) -> None:
         """Enforce minimum delay between requests to the same domain."""
-        with self._lock:
-            last = self._domain_timestamps.get(domain, 0)
-            elapsed = time.time() - last
-            if elapsed < cfg.ENRICHER_SAME_DOMAIN_DELAY:
-                wait = cfg.ENRICHER_SAME_DOMAIN_DELAY - elapsed
-                time.sleep(wait)
-            self._domain_timestamps[domain] = time.time()
+        lock, slots, _ = self._shard(domain)
+        with lock:
+            # Reserve the next free slot for this domain, then sleep outside
+            # the lock so other domains in the shard are not held up
+            now = time.monotonic()
+            last = slots.get(domain, float("-inf"))
+            slot = max(now, last + cfg.ENRICHER_SAME_DOMAIN_DELAY)
+            slots[domain] = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _in_cooldown(self, domain: str) -> bool:
+        """True while *domain* is benched after repeated failed fetches."""
+        lock, _, failures = self._shard(domain)
+        with lock:
+            count, stamp = failures.get(domain, (0, 0.0))
+        return (
+            count >= cfg.ENRICHER_DOMAIN_MAX_FAILURES
+            and time.monotonic() - stamp < cfg.ENRICHER_DOMAIN_COOLDOWN
+        )
+
+    def _record_outcome(self, domain: str, ok: bool) -> None:
+        """Reset the failure streak on success, extend it on failure."""
+        lock, _, failures = self._shard(domain)
+        with lock:
+            if ok:
+                failures.pop(domain, None)
+            else:
+                count = failures.get(domain, (0, 0.0))[0]
+                failures[domain] = (count + 1, time.monotonic())
 
     def get(self, url: str) -> Optional[str]:
         """
@@ -80,22 +177,63 @@ class StealthHTTPClient:
 
         Returns None on unrecoverable failure (after retries).
         """
-        domain = urlparse(url).netloc
+        parsed = urlparse(url)
+        domain = parsed.netloc
+        if self._in_cooldown(domain):
+            logger.debug("Skipping {} (domain cooling down after failures)", url)
+            return None
         self._rate_limit(domain)
+        session = self._session()
+        referer = f"{parsed.scheme}://{domain}/"
 
         last_exc: Exception | None = None
 
         for attempt in range(1, cfg.ENRICHER_MAX_RETRIES + 1):
             try:
-                resp = cffi_requests.get(
-                    url,
-                    headers=self._random_headers(url),
-                    timeout=cfg.ENRICHER_REQUEST_TIMEOUT,
-                    impersonate="chrome120",
-                    allow_redirects=True,
-                )
+                # Randomised but realistic browser headers
+                headers = {
+                    **_BASE_HEADERS,
+                    "User-Agent": _USER_AGENTS[
+                        random.randrange(len(_USER_AGENTS))
+                    ],
+                    "Accept-Language": _ACCEPT_LANGUAGES[
+                        random.randrange(len(_ACCEPT_LANGUAGES))
+                    ],
+                    "Referer": referer,
+                }
+                with self._limiter.acquire():
+                    resp = session.get(
+                        url,
+                        headers=headers,
+                        timeout=cfg.ENRICHER_REQUEST_TIMEOUT,
+                        allow_redirects=True,
+                    )
                 if resp.status_code == 200:
+                    self._limiter.on_success()
+                    self._record_outcome(domain, ok=True)
                     return resp.text
+                if resp.status_code == 429:
+                    self._limiter.on_429()
+                # Rate-limited / unavailable with a short Retry-After: wait
+                # exactly as long as the server asks, then try again
+                wait = (
+                    _retry_after(resp)
+                    if resp.status_code in (429, 503)
+                    else None
+                )
+                if (
+                    wait is not None
+                    and wait <= cfg.ENRICHER_RETRY_AFTER_MAX
+                    and attempt < cfg.ENRICHER_MAX_RETRIES
+                ):
+                    logger.debug(
+                        "HTTP {} for {} -- retrying after {:.1f}s",
+                        resp.status_code,
+                        domain,
+                        wait,
+                    )
+                    time.sleep(wait)
+                    continue
                 if resp.status_code in (403, 401, 429, 503):
                     logger.debug(
                         "HTTP {} for {} (attempt {}/{})",
@@ -104,7 +242,9 @@ class StealthHTTPClient:
                         attempt,
                         cfg.ENRICHER_MAX_RETRIES,
                     )
-                    # Don't retry auth/block errors -- skip immediately
+                    # Don't retry auth/block errors -- skip immediately, but
+                    # count them so a blocking domain reaches its cooldown
+                    self._record_outcome(domain, ok=False)
                     return None
                 # Other non-200
                 logger.debug(
@@ -124,10 +264,11 @@ class StealthHTTPClient:
                     exc,
                 )
 
-            # Exponential backoff before retry
+            # Exponential backoff with full jitter before retry
             if attempt < cfg.ENRICHER_MAX_RETRIES:
-                time.sleep(min(2 ** attempt, 8))
+                time.sleep(random.uniform(0, min(2 ** attempt, 8)))
 
+        self._record_outcome(domain, ok=False)
         if last_exc:
             logger.debug("All retries exhausted for {}: {}", domain, last_exc)
         return None
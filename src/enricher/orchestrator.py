@@ -6,9 +6,10 @@ ThreadPoolExecutor for concurrent processing.
 """
 
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import List
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Optional
+from urllib.parse import urlparse
 
 from loguru import logger
 
@@ -17,12 +18,80 @@ from src.models.business import Business
 from src.enricher.http_client import StealthHTTPClient
 from src.enricher.tier1_regex import extract_email_tier1
 from src.enricher.tier2_dom import extract_email_tier2
-from src.enricher.tier3_browser import extract_email_tier3
+from src.enricher.tier3_browser import extract_email_tier3, shutdown_tier3
+from src.utils.clock import utc_now
+
+
+# (email, enrichment_status, enrichment_method) for one website
+_Outcome = tuple[Optional[str], str, Optional[str]]
+
+
+def _run_tiers(url: str, client: StealthHTTPClient) -> _Outcome:
+    """Run Tiers 1 -> 2 -> 3 for *url* and return the final outcome."""
+    # -- Tier 1: Fast regex ------------------------------------------------
+    email, raw_html = extract_email_tier1(url, client)
+    if email:
+        return email, "tier1_success", "tier1_regex"
+
+    # -- Tier 2: DOM + contact page ----------------------------------------
+    email = extract_email_tier2(url, client, html=raw_html)
+    if email:
+        return email, "tier2_success", "tier2_dom"
+
+    # -- Tier 3: Playwright JS render --------------------------------------
+    email = extract_email_tier3(url, client, raw_html=raw_html)
+    if email:
+        return email, "tier3_success", "tier3_browser"
+
+    # -- All tiers failed --------------------------------------------------
+    return None, "failed", None
+
+
+class _ResultCache:
+    """
+    Memoise the final pipeline outcome per website.
+
+    Chains and franchises often list the same website for many branches;
+    only the first lookup runs the tiers (including the contact-page crawl
+    and any Tier 3 render), and concurrent lookups for the same site wait
+    on that one run instead of repeating it.  Only the small outcome tuple
+    is kept -- never the page HTML.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self._max_size = max_size
+        self._entries: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        parsed = urlparse(url)
+        host = parsed.netloc.lower().removeprefix("www.")
+        return host + parsed.path.rstrip("/")
+
+    def lookup(self, url: str, client: StealthHTTPClient) -> _Outcome:
+        key = self._key(url)
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = self._entries[key] = Future()
+                if len(self._entries) > self._max_size:
+                    # FIFO eviction -- dicts keep insertion order
+                    del self._entries[next(iter(self._entries))]
+
+        if owner:
+            try:
+                future.set_result(_run_tiers(url, client))
+            except Exception as exc:
+                future.set_exception(exc)
+        return future.result()
 
 
 def _process_single(
     business: Business,
     client: StealthHTTPClient,
+    cache: Optional[_ResultCache] = None,
 ) -> Business:
     """
     Run the tiered email pipeline for a single business.
@@ -34,37 +103,16 @@ def _process_single(
         return business
 
     url = business.website
+    if cache is not None:
+        email, status, method = cache.lookup(url, client)
+    else:
+        email, status, method = _run_tiers(url, client)
 
-    # -- Tier 1: Fast regex ------------------------------------------------
-    email, raw_html = extract_email_tier1(url, client)
-    if email:
-        business.email = email
-        business.enrichment_status = "tier1_success"
-        business.enrichment_method = "tier1_regex"
-        business.enriched_at = datetime.utcnow()
-        return business
-
-    # -- Tier 2: DOM + contact page ----------------------------------------
-    email = extract_email_tier2(url, client, html=raw_html)
-    if email:
-        business.email = email
-        business.enrichment_status = "tier2_success"
-        business.enrichment_method = "tier2_dom"
-        business.enriched_at = datetime.utcnow()
-        return business
-
-    # -- Tier 3: Playwright JS render --------------------------------------
-    email = extract_email_tier3(url, client, raw_html=raw_html)
     if email:
         business.email = email
-        business.enrichment_status = "tier3_success"
-        business.enrichment_method = "tier3_browser"
-        business.enriched_at = datetime.utcnow()
-        return business
-
-    # -- All tiers failed --------------------------------------------------
-    business.enrichment_status = "failed"
-    business.enriched_at = datetime.utcnow()
+        business.enrichment_method = method
+    business.enrichment_status = status
+    business.enriched_at = utc_now()
     return business
 
 
@@ -109,42 +157,33 @@ def enrich_businesses(
     )
 
     client = StealthHTTPClient()
-    completed = 0
-    lock = threading.Lock()
-
-    # Counters for the summary
-    stats = {
-        "tier1_success": 0,
-        "tier2_success": 0,
-        "tier3_success": 0,
-        "no_website": len(without_website),
-        "failed": 0,
-    }
-
-    def _worker(biz: Business) -> Business:
-        nonlocal completed
-        result = _process_single(biz, client)
-        with lock:
-            completed += 1
-            if result.enrichment_status:
-                stats[result.enrichment_status] = (
-                    stats.get(result.enrichment_status, 0) + 1
-                )
-            if completed % 10 == 0 or completed == len(with_website):
-                logger.info(
-                    "  Enrichment progress: {}/{}", completed, len(with_website)
-                )
-        return result
-
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(_worker, b): b for b in with_website}
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as exc:
-                biz = futures[future]
-                logger.warning("Enrichment crashed for {}: {}", biz.name, exc)
-                biz.enrichment_status = "failed"
+    cache = _ResultCache()
+    # Futures are drained on this thread, so progress needs no locking
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_process_single, b, client, cache): b
+                for b in with_website
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as exc:
+                    biz = futures[future]
+                    logger.warning("Enrichment crashed for {}: {}", biz.name, exc)
+                    biz.enrichment_status = "failed"
+                if completed % 10 == 0 or completed == len(with_website):
+                    logger.info(
+                        "  Enrichment progress: {}/{}",
+                        completed,
+                        len(with_website),
+                    )
+    finally:
+        # Tier 3 keeps its browsers warm across businesses -- close them now
+        shutdown_tier3()
+
+    # Counters for the summary (every business carries its final status)
+    stats = Counter(b.enrichment_status for b in businesses)
 
     # Log summary
     total = len(businesses)
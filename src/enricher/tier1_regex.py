@@ -14,22 +14,103 @@ from loguru import logger
 from src.enricher.filters import clean_email
 from src.enricher.http_client import StealthHTTPClient
 
+try:  # RE2 scans in linear time; optional, see _pick_patterns()
+    import re2
+except ImportError:
+    re2 = None
+
 # ── Email regex patterns (ordered by specificity) ─────────────────────────
 
-# 1. mailto: links  (highest confidence)
-_MAILTO_RE = re.compile(
-    r"mailto:([a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})", re.IGNORECASE
-)
+_MAILTO = r"mailto:([a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})"
+_PLAINTEXT = r"\b([a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})\b"
+_URLENCODED = r"\b([a-zA-Z0-9._%+\-]+%40[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})\b"
+
+
+def _compile(engine) -> list:
+    """(pattern, label) pairs in confidence order, compiled with *engine*."""
+    return [
+        # 1. mailto: links  (highest confidence)
+        (engine.compile("(?i)" + _MAILTO), "mailto"),
+        # 2. Plain text email addresses
+        (engine.compile(_PLAINTEXT), "plaintext"),
+        # 3. URL-encoded emails (%40 = @)
+        (engine.compile(_URLENCODED), "urlencoded"),
+    ]
+
+
+_RE_PATTERNS = _compile(re)
+_RE2_PATTERNS = _compile(re2) if re2 is not None else None
+
+# RE2 scans a page ~2.5x faster than stdlib re but pays ~3x more per match
+# (its Python wrapper builds each match object).  On 20 KB - 1.4 MB pages
+# the two break even at ~230 characters per "@" -- denser pages are mostly
+# "logo@2x.png"-style asset names that the plaintext pass has to reject
+# one by one -- so RE2 only gets pages sparser than this.
+_RE2_MIN_CHARS_PER_AT = 300
+
+
+def _pick_patterns(html: str) -> tuple[list, bool]:
+    """Return (patterns, is_re2) for *html*, RE2 only on sparse-"@" pages."""
+    if _RE2_PATTERNS is not None and (
+        len(html) >= _RE2_MIN_CHARS_PER_AT * html.count("@")
+    ):
+        return _RE2_PATTERNS, True
+    return _RE_PATTERNS, False
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _on_word_boundary(html: str, start: int, end: int) -> bool:
+    """
+    True when html[start:end] is not glued to a Unicode word character.
+
+    RE2's ``\\b`` only knows ASCII word characters, so on "héllo@site.com"
+    it would happily match "llo@site.com"; stdlib ``re`` (and this check)
+    treat "é" as part of the word and reject the hit.
+    """
+    if start and _is_word_char(html[start - 1]):
+        return False
+    return not (end < len(html) and _is_word_char(html[end]))
+
+
+def scan_html(html: str) -> Optional[str]:
+    """
+    Return the best email in *html*: mailto, then plaintext, then URL-encoded.
+
+    >>> scan_html('<a href="mailto:info@shop.com">x</a> sales@shop.com')
+    'info@shop.com'
+    >>> scan_html("x info@shop.commailto:ok@fine.io")
+    'ok@fine.io'
+    >>> scan_html("contact héllo@site.com today") is None
+    True
+    """
+    # No "@" anywhere means no email -- a C-level substring check is far
+    # cheaper than letting the regex engine walk the whole page to find out
+    if "@" not in html and "%40" not in html:
+        return None
+
+    patterns, is_re2 = _pick_patterns(html)
 
-# 2. Plain text email addresses
-_PLAINTEXT_RE = re.compile(
-    r"\b([a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})\b"
-)
+    # Try patterns in order of confidence
+    for pattern, label in patterns:
+        if label == "urlencoded" and "%40" not in html:
+            break
+        for match in pattern.finditer(html):
+            if is_re2 and label != "mailto" and not _on_word_boundary(
+                html, match.start(), match.end()
+            ):
+                continue
+            raw = match.group(1)
+            if label == "urlencoded":
+                raw = unquote(raw)
+            email = clean_email(raw)
+            if email:
+                logger.debug("Tier 1 ({}) found: {}", label, email)
+                return email
 
-# 3. URL-encoded emails (%40 = @)
-_URLENCODED_RE = re.compile(
-    r"\b([a-zA-Z0-9._%+\-]+%40[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,})\b"
-)
+    return None
 
 
 def extract_email_tier1(
@@ -55,19 +136,4 @@ def extract_email_tier1(
     if not html:
         return None, None
 
-    # Try patterns in order of confidence
-    for pattern, label in [
-        (_MAILTO_RE, "mailto"),
-        (_PLAINTEXT_RE, "plaintext"),
-        (_URLENCODED_RE, "urlencoded"),
-    ]:
-        for match in pattern.finditer(html):
-            raw = match.group(1)
-            if label == "urlencoded":
-                raw = unquote(raw)
-            email = clean_email(raw)
-            if email:
-                logger.debug("Tier 1 ({}) found: {}", label, email)
-                return email, html
-
-    return None, html
+    return scan_html(html), html
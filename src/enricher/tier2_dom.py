@@ -1,5 +1,5 @@
 """
-Tier 2: DOM-based email extraction with BeautifulSoup.
+Tier 2: DOM-based email extraction with selectolax (Lexbor backend).
 
 - Parses <a href="mailto:..."> attributes
 - Decodes Cloudflare-obfuscated emails (data-cfemail XOR)
@@ -12,8 +12,8 @@ import re
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
 from loguru import logger
+from selectolax.lexbor import LexborHTMLParser
 
 from src.enricher.deobfuscator import decode_cloudflare_email
 from src.enricher.filters import clean_email
@@ -24,7 +24,7 @@ from src.enricher.http_client import StealthHTTPClient
 _CONTACT_RE = re.compile(r"(contact|about|reach-us|get-in-touch)", re.IGNORECASE)
 
 
-def _extract_from_soup(soup: BeautifulSoup) -> Optional[str]:
+def _extract_from_tree(tree: LexborHTMLParser) -> Optional[str]:
     """
     Scan a parsed DOM tree for email addresses.
 
@@ -32,20 +32,27 @@ def _extract_from_soup(soup: BeautifulSoup) -> Optional[str]:
     1. <a href="mailto:..."> links
     2. Cloudflare-obfuscated <span data-cfemail="..."> / <a data-cfemail="...">
     3. Cloudflare /cdn-cgi/l/email-protection#HEX href links
+
+    Anchors are walked once; protection links found along the way are
+    only decoded if checks 1 and 2 come up empty.
     """
-    # 1. mailto: attributes
-    for tag in soup.find_all("a", href=True):
-        href = tag["href"]
-        if href.lower().startswith("mailto:"):
+    protected: list[str] = []
+
+    # 1. mailto: attributes (collecting check 3 candidates in the same walk)
+    for tag in tree.css("a[href]"):
+        href = tag.attributes.get("href") or ""
+        if href[:7].lower() == "mailto:":
             raw = href[7:].split("?")[0]  # strip ?subject=... params
             email = clean_email(raw)
             if email:
                 logger.debug("Tier 2 (mailto attr) found: {}", email)
                 return email
+        elif "/cdn-cgi/l/email-protection#" in href:
+            protected.append(href.split("#", 1)[1])
 
     # 2. data-cfemail spans and links
-    for tag in soup.find_all(attrs={"data-cfemail": True}):
-        encoded = tag["data-cfemail"]
+    for tag in tree.css("[data-cfemail]"):
+        encoded = tag.attributes.get("data-cfemail") or ""
         decoded = decode_cloudflare_email(encoded)
         if decoded:
             email = clean_email(decoded)
@@ -54,31 +61,27 @@ def _extract_from_soup(soup: BeautifulSoup) -> Optional[str]:
                 return email
 
     # 3. /cdn-cgi/l/email-protection#HEX links
-    for tag in soup.find_all("a", href=True):
-        href = tag["href"]
-        if "/cdn-cgi/l/email-protection#" in href:
-            hex_part = href.split("#", 1)[1]
-            decoded = decode_cloudflare_email(hex_part)
-            if decoded:
-                email = clean_email(decoded)
-                if email:
-                    logger.debug("Tier 2 (cf protection link) found: {}", email)
-                    return email
+    for hex_part in protected:
+        decoded = decode_cloudflare_email(hex_part)
+        if decoded:
+            email = clean_email(decoded)
+            if email:
+                logger.debug("Tier 2 (cf protection link) found: {}", email)
+                return email
 
     return None
 
 
-def _find_contact_urls(soup: BeautifulSoup, base_url: str) -> list[str]:
+def _find_contact_urls(tree: LexborHTMLParser, base_url: str) -> list[str]:
     """Find up to 3 internal links that look like contact/about pages."""
     base_domain = urlparse(base_url).netloc
     candidates: list[str] = []
 
-    for tag in soup.find_all("a", href=True):
-        href = tag["href"]
-        text = tag.get_text(strip=True).lower()
+    for tag in tree.css("a[href]"):
+        href = tag.attributes.get("href") or ""
 
-        # Match by link text or href path
-        if _CONTACT_RE.search(text) or _CONTACT_RE.search(href):
+        # Match by href path first; only pull link text when that misses
+        if _CONTACT_RE.search(href) or _CONTACT_RE.search(tag.text(strip=True)):
             full_url = urljoin(base_url, href)
             # Only follow same-domain links
             if urlparse(full_url).netloc == base_domain:
@@ -119,22 +122,22 @@ def extract_email_tier2(
     if not html:
         return None
 
-    soup = BeautifulSoup(html, "lxml")
+    # Parse once; the same tree serves the email scan and the link search
+    tree = LexborHTMLParser(html)
 
     # Try homepage DOM first
-    email = _extract_from_soup(soup)
+    email = _extract_from_tree(tree)
     if email:
         return email
 
     # Crawl contact/about sub-pages (depth 1)
-    contact_urls = _find_contact_urls(soup, url)
+    contact_urls = _find_contact_urls(tree, url)
     for contact_url in contact_urls:
         logger.debug("Tier 2 following contact page: {}", contact_url)
         contact_html = client.get(contact_url)
         if not contact_html:
             continue
-        contact_soup = BeautifulSoup(contact_html, "lxml")
-        email = _extract_from_soup(contact_soup)
+        email = _extract_from_tree(LexborHTMLParser(contact_html))
         if email:
             return email
 
@@ -7,9 +7,17 @@ indicators of a JS framework (React, Vue, Angular, Next.js, Nuxt).
 Uses Playwright (already installed for Stage 1) to fully render the
 page, then passes the rendered HTML to Tier 2's DOM parser.
 
+Chromium is launched once per render thread and reused for every page;
+each URL only gets a fresh browser context. The sync Playwright API is
+bound to the thread that started it, so all browser calls run on a small
+pool of dedicated render threads.
+
 Success rate boost: ~+10% (total ~95%).
 """
 
+import queue
+import threading
+from concurrent.futures import Future
 from typing import Optional
 
 from loguru import logger
@@ -19,6 +27,141 @@ from src.enricher.http_client import StealthHTTPClient
 from src.enricher.tier2_dom import extract_email_tier2
 
 
+# Resolves as soon as the rendered DOM shows an email or a mailto: link
+_EMAIL_VISIBLE_JS = (
+    "() => /\\b[\\w.+-]+@[\\w.-]+\\.[a-z]{2,}\\b/i"
+    ".test(document.documentElement.innerText)"
+    " || !!document.querySelector('a[href^=\"mailto:\"]')"
+)
+
+
+# ── Shared render pool ────────────────────────────────────────────────────
+
+def _render_page(browser, url: str) -> str:
+    """Open *url* in a fresh context on *browser*; return the rendered HTML."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright_stealth import Stealth
+
+    context = browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        locale="en-US",
+    )
+    try:
+        page = context.new_page()
+
+        stealth = Stealth()
+        stealth.apply_stealth_sync(page)
+
+        page.goto(url, wait_until="domcontentloaded", timeout=15_000)
+        # Give JS up to 3s to render, but stop waiting once an email shows up
+        try:
+            # Poll every 250ms rather than every frame: innerText forces
+            # layout, and these pages are already slow to render
+            page.wait_for_function(
+                _EMAIL_VISIBLE_JS, polling=250, timeout=3000
+            )
+        except PlaywrightTimeoutError:
+            pass
+
+        return page.content()
+    finally:
+        context.close()
+
+
+class _RenderPool:
+    """Dedicated threads that each own one long-lived Chromium instance."""
+
+    def __init__(self, size: int) -> None:
+        self._jobs: "queue.Queue[tuple[str, Future] | None]" = queue.Queue()
+        self._threads = [
+            threading.Thread(
+                target=self._run, name=f"tier3-render-{i}", daemon=True
+            )
+            for i in range(size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def render(self, url: str) -> str:
+        """Render *url* on a pool thread and return the page HTML."""
+        future: Future = Future()
+        self._jobs.put((url, future))
+        return future.result()
+
+    def close(self) -> None:
+        """Ask every thread to close its browser, then wait for them."""
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self) -> None:
+        from playwright.sync_api import sync_playwright
+
+        pw = browser = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                url, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if browser is None:
+                        pw = pw or sync_playwright().start()
+                        browser = pw.chromium.launch(
+                            headless=True,
+                            args=["--no-sandbox", "--disable-dev-shm-usage"],
+                        )
+                    future.set_result(_render_page(browser, url))
+                except Exception as exc:
+                    future.set_exception(exc)
+                    # A crashed/disconnected Chromium would fail every later
+                    # job on this thread -- drop it and relaunch on the next
+                    if browser is not None and not browser.is_connected():
+                        logger.warning("Tier 3 browser disconnected, relaunching")
+                        try:
+                            browser.close()
+                        except Exception:
+                            pass
+                        browser = None
+        finally:
+            if browser is not None:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            if pw is not None:
+                try:
+                    pw.stop()
+                except Exception:
+                    pass
+
+
+_pool: _RenderPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> _RenderPool:
+    """Return the shared render pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _RenderPool(cfg.ENRICHER_TIER3_WORKERS)
+        return _pool
+
+
+def shutdown_tier3() -> None:
+    """Close the shared Tier 3 browsers (no-op if none were started)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+        logger.debug("Tier 3 browsers closed")
+
+
 def _is_js_heavy(html: str) -> bool:
     """Check if raw HTML suggests a JS framework that needs rendering."""
     html_lower = html.lower()
@@ -58,28 +201,7 @@ def extract_email_tier3(
     logger.debug("Tier 3 rendering with Playwright: {}", url)
 
     try:
-        from playwright.sync_api import sync_playwright
-        from playwright_stealth import Stealth
-
-        pw = sync_playwright().start()
-        browser = pw.chromium.launch(headless=True, args=["--no-sandbox"])
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-        )
-        page = context.new_page()
-
-        stealth = Stealth()
-        stealth.apply_stealth_sync(page)
-
-        page.goto(url, wait_until="domcontentloaded", timeout=15_000)
-        # Give JS time to render
-        page.wait_for_timeout(3000)
-
-        rendered_html = page.content()
-
-        browser.close()
-        pw.stop()
+        rendered_html = _get_pool().render(url)
 
         if rendered_html:
             # Re-run Tier 2 DOM extraction on the fully rendered HTML
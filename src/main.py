@@ -13,6 +13,7 @@ import time
 import argparse
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 import src.config as cfg
 from src.core.browser import (
@@ -24,9 +25,14 @@ from src.core.scroller import perform_infinite_scroll
 from src.core.parser import extract_listings
 from src.core.error_handler import ErrorHandler
 from src.enricher.orchestrator import enrich_businesses
+from src.models.business import Business
 from src.utils.exporter import export_all
 
 
+# Serialises a whole listing batch in pydantic-core, no per-item dicts
+_BUSINESS_LIST = TypeAdapter(list[Business])
+
+
 # -- Helpers ---------------------------------------------------------------
 
 def _query_label(query: str) -> str:
@@ -94,13 +100,14 @@ def run_query(
             )
 
         # -- Checkpoint ----------------------------------------------------
-        records = [item.model_dump(mode="json") for item in listings]
-        error_handler.save_checkpoint(records, name)
+        error_handler.save_checkpoint(_BUSINESS_LIST.dump_json(listings), name)
 
         # -- Export --------------------------------------------------------
         output_dir = cfg.OUTPUT_DIR
         output_dir.mkdir(parents=True, exist_ok=True)
-        paths = export_all(listings, output_dir, name)
+        paths = export_all(
+            listings, output_dir, name, compress=cfg.EXPORT_COMPRESS
+        )
 
         # Clean checkpoint after successful export
         error_handler.clear_checkpoint(name)
@@ -7,6 +7,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from src.utils.clock import utc_now
+
 
 class Business(BaseModel):
     """All data extractable from a Google Maps sidebar card + enrichment."""
@@ -22,7 +24,7 @@ class Business(BaseModel):
     category: Optional[str] = Field(None, description="Business category")
     query_source: str = Field(..., description="The query that produced this result")
     scraped_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="UTC timestamp of when the record was scraped",
     )
 
@@ -38,3 +40,13 @@ class Business(BaseModel):
     enriched_at: Optional[datetime] = Field(
         None, description="Timestamp of enrichment"
     )
+
+    @classmethod
+    def from_trusted(cls, **data) -> "Business":
+        """
+        Build a record from already-clean values without running validators.
+
+        Only for data produced by this project's own parser/enricher; use
+        the normal constructor for anything external.
+        """
+        return cls.model_construct(**data)
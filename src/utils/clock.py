@@ -0,0 +1,24 @@
+"""
+Shared UTC clock for record timestamps.
+"""
+
+import time
+from datetime import datetime, timezone
+
+_cached: tuple[float, datetime] = (0.0, datetime.fromtimestamp(0, tz=timezone.utc))
+
+
+def utc_now() -> datetime:
+    """
+    Current time as a timezone-aware UTC datetime.
+
+    Refreshed at most once per second -- record timestamps don't need
+    finer resolution, and bulk scrape/enrich loops call this per row.
+    """
+    global _cached
+    now = time.time()
+    stamp, value = _cached
+    if now - stamp >= 1.0:
+        value = datetime.fromtimestamp(now, tz=timezone.utc)
+        _cached = (now, value)
+    return value
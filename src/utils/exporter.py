@@ -1,77 +1,475 @@
 """
-Export scraped data to CSV and JSON.
+Export scraped data to CSV, JSON, JSON Lines and (optionally)
+MessagePack / Parquet, with optional zstd compression of the text formats.
 """
 
-import json
+import csv
+import importlib.util
+import io
+import operator
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Sequence, get_args
 
-import pandas as pd
 from loguru import logger
 
 from src.models.business import Business
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# pyarrow costs a few hundred ms to import -- only probe for it here and
+# pull it in on first use (see ``_arrow``)
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_CSV_FIELDS = tuple(Business.model_fields)
+_CSV_HEADER = ",".join(_CSV_FIELDS) + "\r\n"
+# Exports flush to disk in ~10 MiB batches; Python's BufferedWriter already
+# coalesces the many small per-record writes into one write() per batch
+_WRITE_BUFFER = 10 << 20
+_ZSTD_LEVEL = 3
+
+# Parent directories already created -- export_all writes several files
+# into the same folder, often from parallel threads
+_ensured_dirs: set[Path] = set()
+_ensured_dirs_lock = threading.Lock()
+
 
 def _ensure_dir(path: Path) -> None:
-    """Create parent directories if they don't exist."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    """Create parent directories if they don't exist (once per process)."""
+    parent = path.parent
+    if parent in _ensured_dirs:
+        return
+    with _ensured_dirs_lock:
+        if parent not in _ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(parent)
+
+
+def _output_path(path: Path, compress: bool) -> Path:
+    """Final on-disk name -- ``.zst`` is appended for compressed output."""
+    return path.with_name(path.name + ".zst") if compress else path
+
+
+@contextmanager
+def _open_output(path: Path, compress: bool = False):
+    """Binary write handle for *path*, zstd-compressed on the fly if asked."""
+    if compress and zstandard is None:
+        raise ImportError("zstandard is not installed (pip install zstandard)")
+    _ensure_dir(path)
+    with open(path, "wb", buffering=_WRITE_BUFFER) as raw:
+        if not compress:
+            yield raw
+            return
+        # threads=-1 lets libzstd compress on all cores in the background
+        cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+        with cctx.stream_writer(raw, closefd=False) as fh:
+            yield fh
+
+
+@lru_cache(maxsize=None)
+def _arrow():
+    """Import pyarrow on first use; returns ``(pa, pa.parquet)``."""
+    import pyarrow
+    import pyarrow.parquet
 
+    return pyarrow, pyarrow.parquet
 
-def export_to_csv(data: List[Business], output_path: Path) -> Path:
+
+@lru_cache(maxsize=None)
+def _arrow_schema():
     """
-    Write listings to a CSV file using pandas.
+    Fixed Arrow schema for Business records, in field order.
 
-    Returns the resolved output path.
+    Derived from ``Business.model_fields`` rather than inferred from the
+    data, so an all-None column keeps its real type and files from
+    different runs share one schema.
     """
+    pa, _ = _arrow()
+    types_map = {
+        float: pa.float64(),
+        int: pa.int64(),
+        datetime: pa.timestamp("us", tz="UTC"),
+    }
+    fields = []
+    for name, info in Business.model_fields.items():
+        # Unwrap Optional[X]
+        types = get_args(info.annotation) or (info.annotation,)
+        arrow_type = next(
+            (types_map[t] for t in types if t in types_map), pa.string()
+        )
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Render a datetime exactly as ``model_dump(mode="json")`` does."""
+    if value is None:
+        return None
+    return value.isoformat().replace("+00:00", "Z")
+
+
+# Reading the attributes directly, in CSV column order, skips Pydantic's
+# generic serialiser and the dict it builds for every record
+_csv_values = operator.attrgetter(*_CSV_FIELDS)
+_CSV_DATETIME_COLUMNS = tuple(
+    i
+    for i, info in enumerate(Business.model_fields.values())
+    if datetime in (get_args(info.annotation) or (info.annotation,))
+)
+
+
+def _csv_row(item: Business) -> list:
+    """Return *item*'s CSV values in ``_CSV_FIELDS`` order."""
+    row = list(_csv_values(item))
+    for i in _CSV_DATETIME_COLUMNS:
+        row[i] = _iso(row[i])
+    return row
+
+
+def _write_csv_stdlib(
+    rows: Iterable[Sequence], output_path: Path, compress: bool
+) -> int:
+    """Row-by-row CSV write with the stdlib csv module; returns row count."""
+    count = 0
+    with _open_output(output_path, compress) as sink:
+        fh = io.TextIOWrapper(sink, encoding="utf-8", newline="")
+        try:
+            # Field names are plain identifiers -- no quoting needed
+            fh.write(_CSV_HEADER)
+            writerow = csv.writer(fh).writerow
+            for count, row in enumerate(rows, 1):
+                writerow(row)
+        finally:
+            # Flush text into *sink* but leave closing it to _open_output
+            fh.detach()
+    return count
+
+
+def _export_csv_rows(
+    rows: Iterable[Sequence], output_path: Path, compress: bool = False
+) -> Path:
+    """Write value tuples (in ``_CSV_FIELDS`` order) with the stdlib writer."""
+    output_path = _output_path(output_path, compress)
     _ensure_dir(output_path)
-    records = [item.model_dump() for item in data]
-    df = pd.DataFrame(records)
-    df.to_csv(output_path, index=False, encoding="utf-8")
-    logger.info("CSV exported ({} rows)  ->  {}", len(df), output_path)
+    count = _write_csv_stdlib(rows, output_path, compress)
+    logger.info("CSV exported ({} rows)  ->  {}", count, output_path)
     return output_path
 
 
-def export_to_json(data: List[Business], output_path: Path) -> Path:
+def export_to_csv(
+    data: List[Business], output_path: Path, compress: bool = False
+) -> Path:
+    """
+    Write listings to a CSV file.
+
+    Rows come straight from the model attributes and go through the
+    stdlib csv module.  ``compress=True`` writes ``<output_path>.zst``.
+
+    Returns the resolved output path.
+    """
+    return _export_csv_rows(map(_csv_row, data), output_path, compress)
+
+
+def export_to_json(
+    data: List[Business],
+    output_path: Path,
+    pretty: bool = False,
+    compress: bool = False,
+) -> Path:
     """
     Write listings to a JSON file using Pydantic serialisation.
 
+    The array is streamed one record at a time: pydantic-core serialises
+    each model straight to bytes, so no intermediate dicts or full
+    ``records`` list are built.  Output is compact (one record per line)
+    by default; pass ``pretty=True`` for indented, human-readable JSON
+    (roughly 2-3x larger).  ``compress=True`` writes ``<output_path>.zst``.
+
+    Returns the resolved output path.
+    """
+    output_path = _output_path(output_path, compress)
+    indent = 2 if pretty else None
+    count = 0
+    with _open_output(output_path, compress) as fh:
+        fh.write(b"[\n")
+        for item in data:
+            if count:
+                fh.write(b",\n")
+            fh.write(item.model_dump_json(indent=indent).encode("utf-8"))
+            count += 1
+        fh.write(b"\n]\n")
+    logger.info("JSON exported ({} records)  ->  {}", count, output_path)
+    return output_path
+
+
+def export_to_jsonl(
+    data: List[Business], output_path: Path, compress: bool = False
+) -> Path:
+    """
+    Write listings as JSON Lines -- one compact object per line.
+
+    Each record is serialised straight to a string by pydantic-core, so
+    memory stays flat regardless of how many listings there are.
+    ``compress=True`` writes ``<output_path>.zst``.
+
+    Returns the resolved output path.
+    """
+    output_path = _output_path(output_path, compress)
+    count = 0
+    with _open_output(output_path, compress) as fh:
+        for item in data:
+            fh.write(item.model_dump_json().encode("utf-8"))
+            fh.write(b"\n")
+            count += 1
+    logger.info("JSONL exported ({} records)  ->  {}", count, output_path)
+    return output_path
+
+
+def export_csv_and_jsonl(
+    data: List[Business],
+    csv_path: Path,
+    jsonl_path: Path,
+    compress: bool = False,
+) -> tuple[Path, Path]:
+    """
+    Write CSV and JSON Lines in one fused pass over *data*.
+
+    Every listing is visited once: pydantic-core serialises the JSON line
+    and the CSV row is read straight off the model attributes, so both
+    files match what the standalone exporters write byte for byte.
+
+    Returns the resolved ``(csv_path, jsonl_path)`` pair.
+    """
+    jsonl_path = _output_path(jsonl_path, compress)
+
+    def tee(fh):
+        for item in data:
+            fh.write(item.model_dump_json().encode("utf-8"))
+            fh.write(b"\n")
+            yield _csv_row(item)
+
+    with _open_output(jsonl_path, compress) as fh:
+        csv_path = _export_csv_rows(tee(fh), csv_path, compress)
+    logger.info("JSONL exported ({} records)  ->  {}", len(data), jsonl_path)
+    return csv_path, jsonl_path
+
+
+def export_to_msgpack(data: List[Business], output_path: Path) -> Path:
+    """
+    Write listings as a single MessagePack array.
+
+    Smaller and faster to decode than JSON for service-to-service
+    consumers.  Requires the optional ``msgpack`` package.
+
+    Returns the resolved output path.
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is not installed (pip install msgpack)")
+    _ensure_dir(output_path)
+    packer = msgpack.Packer(use_bin_type=True)
+    with open(output_path, "wb", buffering=_WRITE_BUFFER) as fh:
+        fh.write(packer.pack_array_header(len(data)))
+        for item in data:
+            fh.write(packer.pack(item.model_dump(mode="json")))
+    logger.info("MsgPack exported ({} records)  ->  {}", len(data), output_path)
+    return output_path
+
+
+def export_to_parquet(data: List[Business], output_path: Path) -> Path:
+    """
+    Write listings to a zstd-compressed Parquet file via Arrow.
+
+    Columnar, typed and far smaller than CSV -- ideal for downstream
+    analytics.  Requires the optional ``pyarrow`` package.
+
     Returns the resolved output path.
     """
+    if not _HAS_PYARROW:
+        raise ImportError("pyarrow is not installed (pip install pyarrow)")
+    pa, pq = _arrow()
     _ensure_dir(output_path)
-    records = [item.model_dump(mode="json") for item in data]
-    with open(output_path, "w", encoding="utf-8") as fh:
-        json.dump(records, fh, ensure_ascii=False, indent=2, default=str)
-    logger.info("JSON exported ({} records)  ->  {}", len(records), output_path)
+    table = pa.Table.from_pylist(
+        [item.model_dump() for item in data],
+        schema=_arrow_schema(),
+    )
+    pq.write_table(
+        table, output_path, compression="zstd", compression_level=3
+    )
+    logger.info("Parquet exported ({} rows)  ->  {}", len(data), output_path)
     return output_path
 
 
+def _drop_page_cache(path: Path) -> None:
+    """
+    Hint the kernel that *path* won't be re-read soon.
+
+    Exports are write-once, so keeping them in the page cache only evicts
+    pages the scraper still needs.  Linux won't drop dirty pages, so the
+    data is flushed with ``fdatasync`` first and then advised away.  No-op
+    where ``posix_fadvise`` is unavailable (Windows, macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _duplicate(src: Path, dst: Path) -> None:
+    """Make *dst* a byte-identical copy of *src* (hard link when possible)."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+_WRITERS = {
+    "csv": export_to_csv,
+    "json": export_to_json,
+    "jsonl": export_to_jsonl,
+    "msgpack": export_to_msgpack,
+    "parquet": export_to_parquet,
+}
+
+# Formats backed by an optional dependency -> whether it is installed
+_OPTIONAL_DEPS = {"msgpack": msgpack is not None, "parquet": _HAS_PYARROW}
+
+
+# Formats written together by export_csv_and_jsonl when both are requested
+_FUSED = ("csv", "jsonl")
+
+# Text formats that can be zstd-compressed (parquet already is)
+_COMPRESSIBLE = frozenset({"csv", "json", "jsonl"})
+
+
+def _export_formats(
+    fmts: tuple,
+    data: List[Business],
+    output_dir: Path,
+    safe_name: str,
+    compress: bool,
+    pretty: bool,
+) -> dict:
+    """Write one format group (plus enriched twins) and return its paths."""
+    paths = {fmt: output_dir / f"{safe_name}_leads.{fmt}" for fmt in fmts}
+    if fmts == _FUSED:
+        paths["csv"], paths["jsonl"] = export_csv_and_jsonl(
+            data, paths["csv"], paths["jsonl"], compress
+        )
+    else:
+        for fmt in fmts:
+            options = {}
+            if compress and fmt in _COMPRESSIBLE:
+                options["compress"] = True
+            if fmt == "json":
+                options["pretty"] = pretty
+            paths[fmt] = _WRITERS[fmt](data, paths[fmt], **options)
+    for fmt in fmts:
+        _drop_page_cache(paths[fmt])
+
+    # Also save as enriched filenames for clarity (same bytes -- no need
+    # to serialise everything a second time)
+    for fmt in fmts:
+        if fmt in ("csv", "json"):
+            leads = paths[fmt]
+            enriched = output_dir / leads.name.replace(
+                f"{safe_name}_leads.", f"{safe_name}_enriched.", 1
+            )
+            _duplicate(leads, enriched)
+            paths[f"enriched_{fmt}"] = enriched
+    return paths
+
+
 def export_all(
     data: List[Business],
     output_dir: Path,
     query_name: str,
+    formats: Iterable[str] = ("csv", "json", "jsonl"),
+    compress: bool = False,
+    pretty: bool = False,
 ) -> dict:
     """
-    Export leads + enriched versions (CSV and JSON).
+    Export leads in each requested format.
+
+    CSV and JSON are also saved under ``*_enriched`` filenames.  Supported
+    formats: ``csv``, ``json``, ``jsonl``, ``msgpack`` and ``parquet``
+    (the last two are optional dependencies -- skipped with a warning
+    when not installed).  ``compress=True`` zstd-compresses the text
+    formats to ``*.zst`` files (requires the optional ``zstandard``);
+    ``pretty=True`` indents the JSON file for human reading.
 
     Returns a dict with all output file paths.
     """
     safe_name = query_name.replace(" ", "_").lower()
 
-    csv_path = output_dir / f"{safe_name}_leads.csv"
-    json_path = output_dir / f"{safe_name}_leads.json"
-    enriched_csv = output_dir / f"{safe_name}_enriched.csv"
-    enriched_json = output_dir / f"{safe_name}_enriched.json"
+    selected = []
+    for fmt in formats:
+        if fmt not in _WRITERS:
+            logger.warning("Unknown export format '{}' -- skipped", fmt)
+        elif not _OPTIONAL_DEPS.get(fmt, True):
+            logger.warning("{} support not installed -- skipped", fmt)
+        else:
+            selected.append(fmt)
+    if not selected:
+        return {}
+    if compress and zstandard is None:
+        logger.warning("zstandard not installed -- writing uncompressed")
+        compress = False
 
-    export_to_csv(data, csv_path)
-    export_to_json(data, json_path)
+    # CSV + JSONL share a single pass when both are wanted
+    groups = [(fmt,) for fmt in selected if fmt not in _FUSED]
+    if all(fmt in selected for fmt in _FUSED):
+        groups.insert(0, _FUSED)
+    else:
+        groups += [(fmt,) for fmt in selected if fmt in _FUSED]
 
-    # Also save as enriched filenames for clarity
-    export_to_csv(data, enriched_csv)
-    export_to_json(data, enriched_json)
+    # Each group goes to its own files, so the writes can overlap: the
+    # file I/O releases the GIL while another thread serialises
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        futures = [
+            pool.submit(
+                _export_formats,
+                fmts,
+                data,
+                output_dir,
+                safe_name,
+                compress,
+                pretty,
+            )
+            for fmts in groups
+        ]
+        written: dict = {}
+        for future in futures:
+            written.update(future.result())
 
-    return {
-        "csv": csv_path,
-        "json": json_path,
-        "enriched_csv": enriched_csv,
-        "enriched_json": enriched_json,
-    }
+    # Report paths in the order the formats were requested (the fused
+    # CSV + JSONL group always runs first), each followed by its twin
+    paths: dict = {}
+    for fmt in selected:
+        paths[fmt] = written[fmt]
+        if f"enriched_{fmt}" in written:
+            paths[f"enriched_{fmt}"] = written[f"enriched_{fmt}"]
+    return paths